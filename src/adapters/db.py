@@ -7,17 +7,58 @@ Supports extensible driver configuration for future database backends.
 """
 
 import asyncio
+import atexit
+import random
 from os import getenv
 
 from loguru import logger
+from pymongo.errors import ConfigurationError
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
     AsyncIOMotorDatabase,
     AsyncIOMotorCollection,
 )
 
+# Connection settings resolved once at import; repeated getenv calls in
+# the hot path would re-enter the environ lock per connection lookup.
+# DATABASE_DRIVER stays a per-call read so the driver can be switched at
+# runtime (tests rely on this).
+MONGO_URI = getenv("MONGO_URI", "mongodb://localhost:27017")
+MONGO_DATABASE = getenv("MONGO_DATABASE", "tractian")
+
+if MONGO_URI is None:
+    raise ValueError("MONGO_URI is not set")
+
+if MONGO_DATABASE is None:
+    raise ValueError("MONGO_DATABASE is not set")
+
 MAX_RETRIES = 3
-RETRY_DELAY_SECONDS = 2
+
+# Exponential backoff schedule between connection attempts; jitter keeps
+# multiple workers from retrying in lockstep after a shared outage
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_FACTOR = 2
+BACKOFF_MAX_JITTER = 0.5
+BACKOFF_CAP_SECONDS = 30.0
+
+# Connection pool tuning for the shared Motor client
+MAX_POOL_SIZE = 200
+MIN_POOL_SIZE = 10
+MAX_IDLE_TIME_MS = 300_000
+
+# Cached Motor clients keyed by (uri, event loop), so concurrent flows on
+# one loop share a single warm connection pool instead of paying a fresh
+# TCP handshake and monitor-thread spin-up per call
+_clients: dict = {}
+
+
+def _close_cached_clients() -> None:
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+
+atexit.register(_close_cached_clients)
 
 
 async def get_connection() -> AsyncIOMotorDatabase:
@@ -33,16 +74,19 @@ async def get_connection() -> AsyncIOMotorDatabase:
 
 
 async def get_mongodb_connection() -> AsyncIOMotorDatabase:
-    MONGO_URI = getenv("MONGO_URI", "mongodb://localhost:27017")
-    MONGO_DATABASE = getenv("MONGO_DATABASE", "tractian")
-
-    if MONGO_URI is None:
-        raise ValueError("MONGO_URI is not set")
-
-    if MONGO_DATABASE is None:
-        raise ValueError("MONGO_DATABASE is not set")
+    # Reuse the cached client for this URI and event loop if there is one;
+    # clients are loop-bound, so a new loop gets its own client
+    cache_key = (MONGO_URI, asyncio.get_running_loop())
+    client = _clients.get(cache_key)
 
-    client = AsyncIOMotorClient(MONGO_URI)
+    if client is None:
+        client = AsyncIOMotorClient(
+            MONGO_URI,
+            maxPoolSize=MAX_POOL_SIZE,
+            minPoolSize=MIN_POOL_SIZE,
+            maxIdleTimeMS=MAX_IDLE_TIME_MS,
+        )
+        _clients[cache_key] = client
 
     if client is None:
         raise ValueError("Failed to connect to MongoDB")
@@ -55,6 +99,13 @@ async def get_mongodb_connection() -> AsyncIOMotorDatabase:
     return database
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Return the capped exponential backoff delay (with jitter) for an attempt."""
+    delay = BACKOFF_BASE_SECONDS * (BACKOFF_FACTOR ** (attempt - 1))
+    delay *= 1 + random.uniform(0, BACKOFF_MAX_JITTER)
+    return min(BACKOFF_CAP_SECONDS, delay)
+
+
 async def get_mongodb_connection_with_retry() -> AsyncIOMotorDatabase:
     """Get MongoDB connection with retry logic."""
 
@@ -64,11 +115,15 @@ async def get_mongodb_connection_with_retry() -> AsyncIOMotorDatabase:
             # Verify connection
             await database.command("ping")
             return database
+        except ConfigurationError:
+            # Bad URI/options will not recover on retry
+            logger.error("MongoDB configuration error, not retrying")
+            raise
         except Exception:
             logger.warning(f"MongoDB connection attempt {attempt}/{MAX_RETRIES} failed")
 
             if attempt < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY_SECONDS)
+                await asyncio.sleep(_backoff_delay(attempt))
 
     logger.error(f"Failed to connect to MongoDB after {MAX_RETRIES} attempts")
     raise ConnectionError(f"Failed to connect to MongoDB after {MAX_RETRIES} attempts")
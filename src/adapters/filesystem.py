@@ -6,12 +6,27 @@ in directories. Includes error handling for common I/O issues and
 atomic write operations to prevent file corruption.
 """
 
+import functools
 import os
 import json
+import tempfile
 from pathlib import Path
 from typing import List
 from typing import Any
 
+import orjson
+
+
+@functools.lru_cache(maxsize=256)
+def _ensure_directory(directory_path: str) -> None:
+    """
+    Create a directory (and parents) if needed, caching per path.
+
+    Batch exports write many files into the same directory; the cache
+    collapses the per-file stat/mkdir into a single syscall per run.
+    """
+    os.makedirs(directory_path, exist_ok=True)
+
 
 def list_files_in_directory(directory_path: str) -> List[str]:
     """
@@ -29,12 +44,31 @@ def list_files_in_directory(directory_path: str) -> List[str]:
     if not path.is_dir():
         raise NotADirectoryError(f"Path '{directory_path}' is not a directory")
 
-    return [entry.name for entry in os.scandir(path) if entry.is_file()]
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
 
 
 def list_json_files_in_directory(directory_path: str) -> List[str]:
-    """Return all JSON file names in the given directory."""
-    return [name for name in list_files_in_directory(directory_path) if name.lower().endswith(".json")]
+    """
+    Return all JSON file names in the given directory.
+
+    Filters on the .json suffix inside a single scandir pass instead of
+    listing every file first and filtering in a second loop.
+
+    Raises:
+        FileNotFoundError: if the directory does not exist.
+        NotADirectoryError: if the path exists but is not a directory.
+    """
+    path = Path(directory_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Directory '{directory_path}' does not exist")
+
+    if not path.is_dir():
+        raise NotADirectoryError(f"Path '{directory_path}' is not a directory")
+
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if entry.name.lower().endswith(".json") and entry.is_file()]
 
 
 def read_json_from_file(file_path: str | Path) -> Any:
@@ -45,15 +79,18 @@ def read_json_from_file(file_path: str | Path) -> Any:
         FileNotFoundError: if the file does not exist.
         json.JSONDecodeError: if the file content is not valid JSON.
     """
-    path = Path(file_path)
+    # One fspath call at the boundary; Path(...) here would re-join and
+    # re-normalize the string on every read
+    path = os.fspath(file_path)
 
-    if not path.exists():
+    if not os.path.exists(path):
         raise FileNotFoundError(f"File '{file_path}' does not exist")
 
-    with path.open("r", encoding="utf-8") as file:
+    # orjson parses bytes directly, skipping the per-file UTF-8 decode step
+    with open(path, "rb") as file:
         try:
-            return json.load(file)
-        except json.JSONDecodeError as exc:
+            return orjson.loads(file.read())
+        except orjson.JSONDecodeError as exc:
             raise json.JSONDecodeError(
                 f"Invalid JSON in '{file_path}': {exc.msg}",
                 exc.doc,
@@ -70,31 +107,42 @@ def write_json_to_file(file_path: str | Path, data: Any) -> None:
         OSError: if the file cannot be written due to other I/O errors.
         TypeError: if the data is not JSON serializable.
     """
-    file_path_obj = Path(file_path)
+    # One fspath call at the boundary instead of a Path round-trip
+    path = os.fspath(file_path)
+    parent = os.path.dirname(path) or "."
 
-    if not file_path_obj.parent.exists():
-        os.makedirs(file_path_obj.parent, exist_ok=True)
+    _ensure_directory(parent)
+
+    # Serialize up front so non-serializable data fails before any file
+    # is touched. OPT_PASSTHROUGH_DATETIME keeps stdlib-compatible
+    # behavior: raw datetime objects are rejected instead of silently
+    # serialized.
+    try:
+        buffer = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError as e:
+        raise TypeError(f"Data is not JSON serializable") from e
 
-    # Atomic write to avoid corrupted files
-    temp_path = file_path_obj.with_suffix(file_path_obj.suffix + ".tmp")
+    # Atomic write to avoid corrupted files: one write() of the whole
+    # buffer to a raw fd, then rename over the target. mkstemp hands back
+    # a unique open fd in one call, so concurrent writers never collide
+    # on a shared ".tmp" name.
+    fd, temp_name = tempfile.mkstemp(dir=parent, suffix=".tmp")
 
     try:
-        with temp_path.open("w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
-        temp_path.replace(file_path_obj)
+        os.write(fd, buffer)
+        os.fchmod(fd, 0o644)  # mkstemp defaults to 0600
+        os.close(fd)
+        fd = None
+        os.replace(temp_name, path)
     except (PermissionError, OSError):
         # Clean up temp file if it exists
-        if temp_path.exists():
+        if fd is not None:
             try:
-                temp_path.unlink()
+                os.close(fd)
             except OSError:
                 pass
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
         raise
-    except TypeError as e:
-        # Data is not JSON serializable, clean up and raise
-        if temp_path.exists():
-            try:
-                temp_path.unlink()
-            except OSError:
-                pass
-        raise TypeError(f"Data is not JSON serializable") from e
@@ -6,11 +6,25 @@ to the TracOS MongoDB database. Reads JSON files from an inbound directory,
 validates them, translates to TracOS format and saves to the database.
 """
 
+import asyncio
+
 from loguru import logger  # pyright: ignore[reportMissingImports]
 from pathlib import Path
 from integration.system.client.repository import ClientRepository
 from integration.system.tracos.repository import TracOSRepository
-from integration.translators.client_to_tracos import translate_client_to_tracos
+from integration.translators.client_to_tracos import set_default_now, translate_client_to_tracos
+from datetime import datetime, timezone
+
+# Bounded producer/consumer pipeline: file reads feed a queue that a pool
+# of workers drains, so disk I/O, translation and Mongo writes overlap
+WORKER_COUNT = 16
+QUEUE_MAX_SIZE = 64
+
+# Translated workorders are flushed to Mongo in batches of this size
+BATCH_SIZE = 500
+
+# Sentinel pushed once per worker to signal end of input
+_END_OF_STREAM = object()
 
 
 class ClientToTracOSFlow:
@@ -18,32 +32,75 @@ class ClientToTracOSFlow:
         self.client_repository = ClientRepository()
         self.tracos_repository = TracOSRepository()
 
-    async def sync(self, directory_path: Path):
-        logger.info("Syncing Client data with TracOS...")
-
+    async def _produce(self, queue: asyncio.Queue, directory_path: Path):
+        """Stream workorders from the inbound directory into the queue."""
         try:
-            workorders = self.client_repository.find_workorders(str(directory_path))
+            async for workorder in self.client_repository.iter_workorders(str(directory_path)):
+                await queue.put(workorder)
         except FileNotFoundError:
             logger.error(f"Inbound directory not found: '{directory_path}'")
-            return
         except PermissionError:
             logger.error(f"Permission denied accessing inbound directory: '{directory_path}'")
-            return
+        finally:
+            for _ in range(WORKER_COUNT):
+                await queue.put(_END_OF_STREAM)
+
+    async def _consume(self, queue: asyncio.Queue):
+        """Validate, translate and batch-save workorders pulled from the queue."""
+        batch = []
+
+        # Bind the per-iteration callables to locals once, turning the
+        # repeated LOAD_ATTR chains inside the loop into LOAD_FAST
+        get = queue.get
+        validate = self.client_repository.validate_workorder
+        translate = translate_client_to_tracos
+
+        while True:
+            workorder = await get()
 
-        logger.debug(f"Found {len(workorders)} workorders in '{directory_path}'")
+            if workorder is _END_OF_STREAM:
+                break
 
-        for workorder in workorders:
             order_number = workorder.get("orderNo", "unknown")
             try:
-                validated_workorder = self.client_repository.validate_workorder(workorder)
+                validated_workorder = validate(workorder)
 
                 if validated_workorder is None:
                     logger.warning(f"Workorder {order_number} is not valid")
                     continue
 
-                translated_workorder_into_tracos_format = translate_client_to_tracos(validated_workorder)
+                batch.append(translate(validated_workorder))
 
-                await self.tracos_repository.save_workorder(translated_workorder_into_tracos_format)
+                if len(batch) >= BATCH_SIZE:
+                    await self._flush(batch)
+                    batch = []
             except Exception:
                 logger.error(f"Failed to process workorder {order_number}")
                 continue
+
+        if batch:
+            await self._flush(batch)
+
+    async def _flush(self, batch: list):
+        """Save a batch of translated workorders in one bulk round-trip."""
+        try:
+            await self.tracos_repository.bulk_upsert(batch)
+        except Exception:
+            logger.error(f"Failed to save batch of {len(batch)} workorders")
+
+    async def sync(self, directory_path: Path):
+        logger.info("Syncing Client data with TracOS...")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+
+        # Every row with a missing or bad date shares one ingestion time
+        # for this run instead of a clock read per fallback
+        set_default_now(datetime.now(timezone.utc))
+
+        try:
+            await asyncio.gather(
+                self._produce(queue, directory_path),
+                *(self._consume(queue) for _ in range(WORKER_COUNT)),
+            )
+        finally:
+            set_default_now(None)
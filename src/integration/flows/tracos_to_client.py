@@ -6,13 +6,22 @@ to the Client file system. Fetches unsynced workorders from the database,
 translates them to Client format and exports as JSON files to an outbound directory.
 """
 
+import asyncio
+from typing import Optional
+
 from loguru import logger  # pyright: ignore[reportMissingImports]
 from pathlib import Path
 from integration.system.tracos.repository import TracOSRepository
-from integration.translators.tracos_to_client import translate_tracos_to_client
+from integration.translators.tracos_to_client import set_default_now, translate_tracos_to_client
+from datetime import datetime, timezone
 from adapters.filesystem import write_json_to_file
 import os
 
+# Workorders are exported in batches of this size: file writes for one
+# batch run concurrently in threads, then one bulk round-trip marks the
+# whole batch as synced
+BATCH_SIZE = 500
+
 
 class TracOSToClientFlow:
     def __init__(self):
@@ -35,32 +44,70 @@ class TracOSToClientFlow:
             logger.error(f"Failed to create output directory: '{directory_path}'")
             return
 
-        workorder_count = 0
-        async for workorder in self.tracos_repository.find_all_unsynced_workorders():
-            workorder_number = workorder.get("number", "unknown")
+        batch = []
+
+        # Every row with a missing date shares one export time for this
+        # run instead of a clock read per fallback
+        set_default_now(datetime.now(timezone.utc))
+
+        try:
+            async for workorder in self.tracos_repository.find_all_unsynced_workorders():
+                workorder_number = workorder.get("number", "unknown")
+
+                if not self.validate_workorder(workorder):
+                    logger.warning(f"Workorder {workorder_number} is not valid")
+                    continue
+
+                batch.append(workorder)
+
+                if len(batch) >= BATCH_SIZE:
+                    await self._export_batch(batch, directory_path)
+                    batch = []
 
-            if not self.validate_workorder(workorder):
-                logger.warning(f"Workorder {workorder_number} is not valid")
-                continue
+            if batch:
+                await self._export_batch(batch, directory_path)
+        finally:
+            set_default_now(None)
 
-            try:
-                translated_workorder = translate_tracos_to_client(workorder)
+    async def _export_batch(self, batch: list, directory_path: Path):
+        """Write a batch of workorders concurrently, then mark them synced in one round-trip."""
+        # One fspath call per batch; the per-file joins below are C-level
+        directory = os.fspath(directory_path)
 
-                filename = f"{translated_workorder['orderNo']}.json"
-                filepath = directory_path / filename
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._export_workorder, workorder, directory) for workorder in batch)
+        )
 
-                write_json_to_file(str(filepath), translated_workorder)
+        exported_numbers = [number for number in results if number is not None]
 
-                await self.tracos_repository.mark_workorder_as_synced(workorder["number"])
+        if exported_numbers:
+            await self.tracos_repository.mark_workorders_as_synced(exported_numbers)
 
-                workorder_count += 1
-                logger.debug(f"Exported workorder {translated_workorder['orderNo']} to {filepath}")
-            except PermissionError:
-                logger.error(f"Permission denied writing workorder {workorder_number}")
-                continue
-            except OSError:
-                logger.error(f"Failed to write workorder {workorder_number}")
-                continue
-            except Exception:
-                logger.error(f"Failed to process workorder {workorder_number}")
-                continue
+    def _export_workorder(self, workorder: dict, directory: str) -> Optional[int]:
+        """Translate one workorder and write its JSON file. Returns its number, or None on failure."""
+        workorder_number = workorder.get("number", "unknown")
+
+        try:
+            translated_workorder = translate_tracos_to_client(workorder)
+
+            filepath = os.path.join(directory, f"{translated_workorder['orderNo']}.json")
+
+            write_json_to_file(filepath, translated_workorder)
+
+            # Lazy args: the dict lookup and Path formatting only run when
+            # a sink actually consumes DEBUG records
+            logger.opt(lazy=True).debug(
+                "Exported workorder {} to {}",
+                lambda: translated_workorder["orderNo"],
+                lambda: filepath,
+            )
+            return workorder["number"]
+        except PermissionError:
+            logger.error(f"Permission denied writing workorder {workorder_number}")
+            return None
+        except OSError:
+            logger.error(f"Failed to write workorder {workorder_number}")
+            return None
+        except Exception:
+            logger.error(f"Failed to process workorder {workorder_number}")
+            return None
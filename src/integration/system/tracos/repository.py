@@ -6,40 +6,159 @@ Handles CRUD-like operations for workorders stored in the TracOS MongoDB:
 - Inserting or updating entries
 - Marking workorders as synced
 """
+import asyncio
+import functools
 from datetime import datetime, timezone
 from os import getenv
-import json
 from typing import AsyncGenerator, Optional
 
 from bson import ObjectId
 from loguru import logger
+from pymongo import UpdateOne
 from pymongo.errors import PyMongoError
 
 from adapters.db import get_connection, get_collection
 from integration.types import TracOSWorkorder
 
+# Fields every TracOS workorder must carry, built once at import
+_REQUIRED_WORKORDER_FIELDS = frozenset(
+    {"number", "status", "title", "description", "createdAt", "updatedAt", "deleted"}
+)
+
+# Metadata fields excluded when diffing documents, built once at import
+_DIFF_IGNORED = frozenset({"_id", "isSynced", "syncedAt"})
+
+# Fields compared when deciding whether an incoming workorder changed;
+# metadata (_id, isSynced, syncedAt) is deliberately absent
+_COMPARE_FIELDS = ("number", "status", "title", "description", "createdAt", "updatedAt", "deleted")
+
+# Collection name resolved once at import; it never changes at runtime
+_COLLECTION_NAME = getenv("MONGO_COLLECTION", "workorders")
+
+# Documents fetched per cursor round-trip; tuned for workorder size so a
+# getMore neither bloats memory nor fragments into tiny batches
+_CURSOR_BATCH_SIZE = int(getenv("MONGO_CURSOR_BATCH_SIZE", "500"))
+
+# The outbound flow only reads these fields, so the unsynced query asks
+# Mongo to send nothing else — fewer bytes on the wire, less BSON decode
+_UNSYNCED_PROJECTION = {
+    "number": 1,
+    "status": 1,
+    "title": 1,
+    "description": 1,
+    "createdAt": 1,
+    "updatedAt": 1,
+    "deleted": 1,
+    "_id": 0,
+}
+
+
+_EXISTING_PROJECTION = {"_id": 1, **{field: 1 for field in _COMPARE_FIELDS}}
+
+
+def _mongo_op(fn):
+    """Shared error handling for single-document Mongo operations.
+
+    Connection errors propagate to the caller; any other driver error is
+    logged under the operation's name and reported as failure. Keeps the
+    method bodies down to the actual database work.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await fn(self, *args, **kwargs)
+        except ConnectionError:
+            logger.error(f"Connection error in {fn.__name__}")
+            raise
+        except PyMongoError as exc:
+            logger.error(f"{fn.__name__} failed: {exc}")
+            return False
+
+    return wrapper
+
 
 class TracOSRepository:
+    def __init__(self):
+        self._cached_collection = None
+
     async def _collection(self):
-        """Return the MongoDB collection safely."""
-        database = await get_connection()
-        return get_collection(database, getenv("MONGO_COLLECTION", "workorders"))
+        """Return the MongoDB collection, resolving it once per repository."""
+        if self._cached_collection is None:
+            database = await get_connection()
+            self._cached_collection = get_collection(database, _COLLECTION_NAME)
 
-    async def find_all_unsynced_workorders(self) -> AsyncGenerator[TracOSWorkorder, None]:
-        """Yield every workorder where isSynced != True."""
-        try:
-            collection = await self._collection()
-            cursor = collection.find({"isSynced": {"$ne": True}})
+        return self._cached_collection
 
-            async for doc in cursor:
-                yield doc
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the sync queries rely on; safe to call repeatedly.
 
+        Without an index on number, every existence check is a collection
+        scan. The unique constraint also guards against duplicate
+        workorders slipping in through concurrent syncs.
+        """
+        try:
+            collection = await self._collection()
+            await collection.create_index("number", unique=True)
+            # Backs the {"isSynced": {"$ne": True}} query so the planner
+            # can avoid a collection scan on the unsynced sweep
+            await collection.create_index("isSynced")
         except ConnectionError:
-            logger.error("Connection error fetching unsynced workorders")
+            logger.error("Connection error creating indexes")
             raise
         except PyMongoError as exc:
-            logger.error(f"Error fetching unsynced workorders: {exc}")
-            return
+            logger.error(f"Index creation failed: {exc}")
+
+    async def find_all_unsynced_workorders(self) -> AsyncGenerator[TracOSWorkorder, None]:
+        """Yield every workorder where isSynced != True.
+
+        A background task drains the cursor into a bounded queue so the
+        driver prefetches the next batch while the caller is still
+        processing the current one.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_CURSOR_BATCH_SIZE)
+        end_of_stream = object()
+
+        async def _pump():
+            try:
+                collection = await self._collection()
+                # No index hint here: ensure_indexes is best-effort (only
+                # main() calls it, and it swallows creation failures), and
+                # a hard-coded hint raises OperationFailure whenever the
+                # isSynced index is missing — breaking the whole outbound
+                # sync where an unhinted query degrades to a scan. With
+                # the index present the planner picks it on its own.
+                cursor = collection.find({"isSynced": {"$ne": True}}, _UNSYNCED_PROJECTION).batch_size(
+                    _CURSOR_BATCH_SIZE
+                )
+
+                async for doc in cursor:
+                    await queue.put(doc)
+
+            except ConnectionError:
+                logger.error("Connection error fetching unsynced workorders")
+                raise
+            except PyMongoError as exc:
+                logger.error(f"Error fetching unsynced workorders: {exc}")
+            finally:
+                await queue.put(end_of_stream)
+
+        pump_task = asyncio.create_task(_pump())
+
+        try:
+            while True:
+                doc = await queue.get()
+
+                if doc is end_of_stream:
+                    break
+
+                yield doc
+
+            # Surface connection errors to the caller, as before
+            await pump_task
+        finally:
+            if not pump_task.done():
+                pump_task.cancel()
 
     async def get_workorder_by_number(self, number: int) -> Optional[TracOSWorkorder]:
         """Retrieve a workorder by its number."""
@@ -48,7 +167,7 @@ class TracOSRepository:
             workorder = await collection.find_one({"number": number})
 
             if not workorder:
-                logger.debug(f"Workorder {number} not found")
+                logger.debug("Workorder {} not found", number)
                 return None
 
             return TracOSWorkorder(**workorder)
@@ -57,98 +176,177 @@ class TracOSRepository:
             logger.error("Connection error getting workorder by number")
             raise
 
+    @_mongo_op
     async def insert_workorder(self, workorder: TracOSWorkorder) -> bool:
         """Insert a new workorder."""
-        number = workorder.get("number", "unknown")
+        collection = await self._collection()
+        await collection.insert_one(workorder)
+        logger.debug("Inserted workorder {}", workorder.get("number", "unknown"))
+        return True
+
+    @_mongo_op
+    async def update_workorder(self, workorder_id: ObjectId, workorder: TracOSWorkorder) -> bool:
+        """Update an existing workorder by ID."""
+        collection = await self._collection()
+        await collection.update_one({"_id": workorder_id}, {"$set": workorder})
+        logger.debug("Updated workorder {}", workorder_id)
+        return True
+
+    @_mongo_op
+    async def save_workorder(self, workorder: TracOSWorkorder) -> bool:
+        """Insert or update based on workorder.number, in one round-trip.
+
+        The server resolves insert-vs-update itself, so the old
+        find_one -> compare -> update_one sequence collapses from two
+        wire round-trips to one. Re-sending an identical document is a
+        no-op write on the server, so the skip-unchanged behavior is
+        preserved without the read.
+        """
+        number = workorder.get("number")
+
+        collection = await self._collection()
+        await collection.update_one({"number": number}, {"$set": workorder}, upsert=True)
+        logger.debug("Saved workorder {}", number)
+        return True
+
+    async def save_workorders(self, workorders: list[TracOSWorkorder]) -> bool:
+        """Insert or update a batch of workorders with bulk operations.
+
+        New workorders go through a single insert_many and changed ones
+        through a single bulk_write, instead of one round-trip per document.
+        """
+        if not workorders:
+            return True
 
         try:
             collection = await self._collection()
-            await collection.insert_one(workorder)
-            logger.debug(f"Inserted workorder {number}")
+
+            # One $in query resolves existence for the whole batch instead
+            # of a find_one round-trip per workorder
+            numbers = [workorder.get("number") for workorder in workorders]
+            existing_map = {}
+            async for doc in collection.find({"number": {"$in": numbers}}, _EXISTING_PROJECTION):
+                existing_map[doc.get("number")] = doc
+
+            to_insert = []
+            update_ops = []
+
+            for workorder in workorders:
+                number = workorder.get("number")
+                existing = existing_map.get(number)
+
+                if not existing:
+                    to_insert.append(workorder)
+                    continue
+
+                changes = self.diff_workorders(existing, workorder)
+
+                if not changes:
+                    logger.debug("Workorder {} is up-to-date, no changes to be made", number)
+                    continue
+
+                updated_fields = {key: value["after"] for key, value in changes.items()}
+                update_ops.append(UpdateOne({"_id": existing["_id"]}, {"$set": updated_fields}))
+
+            if to_insert:
+                await collection.insert_many(to_insert, ordered=False)
+                logger.opt(lazy=True).debug("Inserted {} workorders", lambda: len(to_insert))
+
+            if update_ops:
+                await collection.bulk_write(update_ops, ordered=False)
+                logger.opt(lazy=True).debug("Updated {} workorders", lambda: len(update_ops))
+
             return True
 
         except ConnectionError:
-            logger.error("Connection error inserting workorder")
+            logger.error("Connection error saving workorder batch")
             raise
         except PyMongoError as exc:
-            logger.error(f"Insert failed for {number}: {exc}")
+            logger.error(f"Batch save failed: {exc}")
             return False
 
-    async def update_workorder(self, workorder_id: ObjectId, workorder: TracOSWorkorder) -> bool:
-        """Update an existing workorder by ID."""
+    async def bulk_upsert(self, workorders: list[TracOSWorkorder]) -> bool:
+        """Upsert a batch of workorders keyed by number in one round-trip.
+
+        Unlike save_workorders this skips the existence pre-query: Mongo
+        resolves insert-vs-update server-side, so the whole batch costs a
+        single unordered bulk_write. $set only touches incoming fields,
+        which keeps sync metadata like isSynced intact on updates.
+        """
+        if not workorders:
+            return True
+
+        ops = [
+            UpdateOne({"number": workorder.get("number")}, {"$set": workorder}, upsert=True) for workorder in workorders
+        ]
+
         try:
             collection = await self._collection()
-            await collection.update_one({"_id": workorder_id}, {"$set": workorder})
-            logger.debug(f"Updated workorder {workorder_id}")
+            await collection.bulk_write(ops, ordered=False)
+            logger.opt(lazy=True).debug("Upserted {} workorders", lambda: len(ops))
             return True
 
         except ConnectionError:
-            logger.error("Connection error updating workorder")
+            logger.error("Connection error upserting workorder batch")
             raise
         except PyMongoError as exc:
-            logger.error(f"Update failed ({workorder_id}): {exc}")
+            logger.error(f"Bulk upsert failed: {exc}")
             return False
 
-    async def save_workorder(self, workorder: TracOSWorkorder) -> bool:
-        """Insert or update based on workorder.number."""
-        number = workorder.get("number")
+    async def mark_workorders_as_synced(self, numbers: list[int]) -> bool:
+        """Set isSynced = True and syncedAt = now for a batch of workorders."""
+        if not numbers:
+            return True
 
-        try:
-            existing = await self.get_workorder_by_number(number)
+        synced_at = datetime.now(timezone.utc)
+        ops = [UpdateOne({"number": number}, {"$set": {"isSynced": True, "syncedAt": synced_at}}) for number in numbers]
 
-            if not existing:
-                return await self.insert_workorder(workorder)
+        try:
+            collection = await self._collection()
+            result = await collection.bulk_write(ops, ordered=False)
 
-            if not self.should_update_workorder(existing, workorder):
-                logger.debug(f"Workorder {number} is up-to-date, no changes to be made")
-                return True
+            if result.modified_count != len(numbers):
+                logger.warning(f"Marked {result.modified_count}/{len(numbers)} workorders as synced")
+                return False
 
-            merged = {**existing, **workorder}
-            return await self.update_workorder(existing["_id"], merged)
+            logger.opt(lazy=True).debug("Marked {} workorders as synced", lambda: len(numbers))
+            return True
 
         except ConnectionError:
-            logger.error("Connection error saving workorder")
             raise
         except PyMongoError as exc:
-            logger.error(f"Save failed for {number}: {exc}")
+            logger.error(f"Bulk sync update failed: {exc}")
             return False
 
+    @_mongo_op
     async def mark_workorder_as_synced(self, number: int) -> bool:
         """Set isSynced = True and syncedAt = now."""
-        try:
-            collection = await self._collection()
-            result = await collection.update_one(
-                {"number": number},
-                {"$set": {"isSynced": True, "syncedAt": datetime.now(timezone.utc)}},
-            )
-
-            if result.modified_count:
-                logger.debug(f"Marked {number} as synced")
-                return True
-
-            logger.warning(f"Workorder {number} not updated as synced")
-            return False
+        collection = await self._collection()
+        result = await collection.update_one(
+            {"number": number},
+            {"$set": {"isSynced": True, "syncedAt": datetime.now(timezone.utc)}},
+        )
+
+        if result.modified_count:
+            logger.debug("Marked {} as synced", number)
+            return True
 
-        except ConnectionError:
-            raise
-        except PyMongoError as exc:
-            logger.error(f"Sync update failed for {number}: {exc}")
-            return False
+        logger.warning(f"Workorder {number} not updated as synced")
+        return False
 
     def _normalize_datetime(self, dt: datetime) -> datetime:
         """Normalize datetime to UTC and truncate to seconds for comparison."""
-        if dt is None:
-            return None
-
-        if not isinstance(dt, datetime):
+        if dt is None or not isinstance(dt, datetime):
             return dt
 
-        # Treat naive datetimes as UTC
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
+        # Fast path: most dates are already tz-aware and second-precision,
+        # so the common case returns the input without allocating
+        if dt.microsecond == 0 and dt.tzinfo is not None:
+            return dt
 
-        # Truncate microseconds for comparison tolerance
-        return dt.replace(microsecond=0)
+        # Treat naive datetimes as UTC and truncate microseconds for
+        # comparison tolerance, in a single replace() allocation
+        return dt.replace(microsecond=0, tzinfo=dt.tzinfo or timezone.utc)
 
     def _values_equal(self, old_value, new_value) -> bool:
         """Compare values with special handling for datetimes."""
@@ -167,11 +365,10 @@ class TracOSRepository:
         Includes: {field: {"before": x, "after": y}}
         Ignores metadata fields.
         """
-        ignored = {"_id", "isSynced", "syncedAt"}
         changes = {}
 
         for key, new_value in incoming.items():
-            if key in ignored:
+            if key in _DIFF_IGNORED:
                 continue
 
             old_value = existing.get(key)
@@ -186,24 +383,28 @@ class TracOSRepository:
         incoming: TracOSWorkorder,
     ) -> bool:
         """Return True if any relevant field differs."""
-        changes = self.diff_workorders(existing, incoming)
-
-        if changes:
-            logger.debug(
-                f"Workorder {existing.get('number')} should be updated. Changes: {json.dumps(changes, indent=2)}"
-            )
-            return True
+        # The workorder shape is fixed, so compare the known fields and
+        # short-circuit on the first mismatch instead of building a diff
+        for field in _COMPARE_FIELDS:
+            if not self._values_equal(existing.get(field), incoming.get(field)):
+                logger.debug("Workorder {} should be updated, '{}' changed", existing.get("number"), field)
+                return True
 
         return False
 
     def validate_workorder(self, workorder: dict) -> bool:
         """Validate required fields for TracOS format."""
-        required = {"number", "status", "title", "description", "createdAt", "updatedAt", "deleted"}
-
-        missing = [f for f in required if workorder.get(f) is None]
+        # Single C-level set difference instead of a per-field loop; the
+        # logger is only touched when the workorder is actually invalid
+        missing = _REQUIRED_WORKORDER_FIELDS - workorder.keys()
 
         if missing:
-            logger.warning(f"Missing fields: {missing}")
+            logger.warning(f"Missing fields: {sorted(missing)}")
+            return False
+
+        if not all(workorder[field] is not None for field in _REQUIRED_WORKORDER_FIELDS):
+            null_fields = sorted(field for field in _REQUIRED_WORKORDER_FIELDS if workorder[field] is None)
+            logger.warning(f"Missing fields: {null_fields}")
             return False
 
         return True
@@ -1,39 +1,84 @@
 """
 Translation logic from Client format to TracOS format.
 """
+import functools
 from datetime import datetime, timezone
+from typing import Optional
+
+import ciso8601
 from integration.translators.status_mappings import map_client_status_to_tracos
 from integration.types import ClientWorkorder, TracOSWorkorder
 
+# timezone.utc pre-bound once; saves an attribute walk on every parse
+_UTC = timezone.utc
+
+# Shared fallback timestamp for the current sync run, set by the flow so
+# every row with a missing or bad date gets one ingestion time instead of
+# a fresh clock read each
+_default_now: Optional[datetime] = None
+
+
+def set_default_now(dt: Optional[datetime]) -> None:
+    """Set (or clear, with None) the shared fallback timestamp for a run."""
+    global _default_now
+    _default_now = dt
+
+
+def _fallback_now() -> datetime:
+    return _default_now or datetime.now(_UTC)
+
 
 def translate_client_to_tracos(client_workorder: ClientWorkorder) -> TracOSWorkorder:
     """Translate a workorder from Client format to TracOS format."""
 
-    # Map status: supports both enum values (e.g., 'NEW') and boolean flags
+    # Map status: supports both enum values (e.g., 'NEW') and boolean flags.
+    # The workorder itself serves as the flags mapping — building a
+    # throwaway five-key dict per row just re-reads the same values
     status = map_client_status_to_tracos(
         status=client_workorder.get("status"),
-        flags={
-            "isDeleted": client_workorder.get("isDeleted", False),
-            "isCanceled": client_workorder.get("isCanceled", False),
-            "isDone": client_workorder.get("isDone", False),
-            "isOnHold": client_workorder.get("isOnHold", False),
-            "isPending": client_workorder.get("isPending", False),
-        },
+        flags=client_workorder,
     )
 
     # Parse dates
     created_at = parse_datetime(client_workorder.get("creationDate"))
     updated_at = parse_datetime(client_workorder.get("lastUpdateDate"))
 
-    return TracOSWorkorder(
-        number=client_workorder.get("orderNo"),
-        status=status,
-        title=client_workorder.get("summary", ""),
-        description=client_workorder.get("summary", ""),
-        createdAt=created_at,
-        updatedAt=updated_at,
-        deleted=client_workorder.get("isDeleted", False),
-    )
+    # Fetched once: title and description share the same string, so the
+    # second .get() was a redundant hash lookup
+    summary = client_workorder.get("summary", "")
+
+    # A dict literal builds the row in one presized BUILD_MAP, where the
+    # TypedDict constructor call paid for a kwargs dict plus a copy
+    translated: TracOSWorkorder = {
+        "number": client_workorder.get("orderNo"),
+        "status": status,
+        "title": summary,
+        "description": summary,
+        "createdAt": created_at,
+        "updatedAt": updated_at,
+        "deleted": client_workorder.get("isDeleted", False),
+    }
+    return translated
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_datetime(date_string: str) -> datetime:
+    """Parse one ISO string to a timezone-aware UTC datetime, cached.
+
+    Batch-imported workorders repeat the same timestamps, so repeat
+    strings become a dict hit instead of a parse. Safe to share results:
+    datetime objects are immutable.
+    """
+
+    # ciso8601 parses in C and handles the trailing 'Z' natively, so no
+    # intermediate string needs to be allocated for the offset rewrite
+    dt = ciso8601.parse_datetime(date_string)
+
+    # Ensure timezone-aware (UTC if naive)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+
+    return dt
 
 
 def parse_datetime(date_string: str) -> datetime:
@@ -44,22 +89,10 @@ def parse_datetime(date_string: str) -> datetime:
     """
 
     if not date_string:
-        return datetime.now(timezone.utc)
+        return _fallback_now()
 
     try:
-        # Handle different ISO formats
-        if "T" in date_string:
-            # ISO format with T separator
-            dt = datetime.fromisoformat(date_string.replace("Z", "+00:00"))
-        else:
-            # Fallback to parsing as ISO
-            dt = datetime.fromisoformat(date_string)
-
-        # Ensure timezone-aware (UTC if naive)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-
-        return dt
-    except (ValueError, AttributeError):
+        return _parse_iso_datetime(date_string)
+    except (ValueError, TypeError):
         # If parsing fails, return current time (timezone-aware UTC)
-        return datetime.now(timezone.utc)
+        return _fallback_now()
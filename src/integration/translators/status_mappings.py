@@ -43,6 +43,24 @@ CLIENT_FLAGS_TO_TRACOS_STATUS: Dict[str, str] = {
     "default": "in_progress",
 }
 
+# Case-expanded lookup so the common spellings hit without paying a
+# .upper() allocation per call; odd mixed case falls back to normalizing
+_CLIENT_STATUS_LOOKUP: Dict[str, str] = {
+    variant: tracos_status
+    for client_status, tracos_status in CLIENT_TO_TRACOS_STATUS.items()
+    for variant in (client_status, client_status.lower(), client_status.title())
+}
+
+# Flag dispatch table in priority order, scanned with an early return
+# instead of an if/elif chain of dict lookups
+_FLAG_DISPATCH = (
+    ("isDeleted", "deleted"),
+    ("isCanceled", "cancelled"),
+    ("isDone", "completed"),
+    ("isOnHold", "on_hold"),
+    ("isPending", "pending"),
+)
+
 
 def map_client_status_to_tracos(status: Optional[str] = None, flags: Optional[Dict[str, bool]] = None) -> str:
     """
@@ -60,31 +78,68 @@ def map_client_status_to_tracos(status: Optional[str] = None, flags: Optional[Di
         TracOS status string (e.g., 'created', 'pending')
     """
 
-    # First priority: use status enum if provided
+    # First priority: use status enum if provided; the expanded table
+    # resolves common spellings without allocating an uppercased copy
     if status:
-        status_upper = status.upper()
-        if status_upper in CLIENT_TO_TRACOS_STATUS:
-            return CLIENT_TO_TRACOS_STATUS[status_upper]
-        # If status not found in mapping, log warning and fall through to flags
+        mapped = _CLIENT_STATUS_LOOKUP.get(status) or CLIENT_TO_TRACOS_STATUS.get(status.upper())
+        if mapped:
+            return mapped
+        # If status not found in mapping, fall through to flags
 
     # Second priority: use boolean flags (backward compatibility)
     if flags:
-        # Check flags in priority order
-        if flags.get("isDeleted", False):
-            return "deleted"
-        elif flags.get("isCanceled", False):
-            return "cancelled"
-        elif flags.get("isDone", False):
-            return "completed"
-        elif flags.get("isOnHold", False):
-            return "on_hold"
-        elif flags.get("isPending", False):
-            return "pending"
+        # Scan flags in priority order
+        for flag, tracos_status in _FLAG_DISPATCH:
+            if flags.get(flag):
+                return tracos_status
 
     # Default status
     return "in_progress"
 
 
+# Baseline client flags; every result starts from a copy of this
+_BASE_CLIENT_FLAGS = {
+    "isCanceled": False,
+    "isDone": False,
+    "isOnHold": False,
+    "isPending": False,
+}
+
+# TracOS statuses that flip one client flag for backward compatibility
+# (deleted is handled separately in the main translation function)
+_TRACOS_STATUS_TO_CLIENT_FLAG = {
+    "completed": "isDone",
+    "cancelled": "isCanceled",
+    "on_hold": "isOnHold",
+    "pending": "isPending",
+}
+
+
+def _build_tracos_status_table() -> Dict[str, StatusMappingResult]:
+    """Precompute the result template for every known TracOS status."""
+    table = {}
+    for tracos_status, client_status in TRACOS_TO_CLIENT_STATUS.items():
+        flags = dict(_BASE_CLIENT_FLAGS)
+        flag = _TRACOS_STATUS_TO_CLIENT_FLAG.get(tracos_status)
+        if flag:
+            flags[flag] = True
+        result = {"status": client_status, "flags": flags}
+        # Case-expanded keys avoid a .lower() allocation for the common
+        # spellings; odd mixed case falls back to normalizing
+        for variant in (tracos_status, tracos_status.upper(), tracos_status.title()):
+            table[variant] = result
+    return table
+
+
+# One precomputed template per status, built once at import; the mapping
+# function derives each result from its template instead of re-deriving
+# the flag combination per call
+_TRACOS_STATUS_TABLE = _build_tracos_status_table()
+
+# Template for missing/unknown statuses
+_EMPTY_STATUS_TEMPLATE = {"status": None, "flags": dict(_BASE_CLIENT_FLAGS)}
+
+
 def map_tracos_status_to_client(status: Optional[str] = None) -> StatusMappingResult:
     """
     Map TracOS status to client format.
@@ -97,37 +152,14 @@ def map_tracos_status_to_client(status: Optional[str] = None) -> StatusMappingRe
         status: TracOS status string (e.g., 'created', 'pending')
 
     Returns:
-        Dictionary with 'status' and 'flags' keys
+        Dictionary with 'status' and 'flags' keys; each call returns a
+        fresh result, safe for callers to mutate.
     """
 
-    result = {
-        "status": None,
-        "flags": {
-            "isCanceled": False,
-            "isDone": False,
-            "isOnHold": False,
-            "isPending": False,
-        },
-    }
-
-    if not status:
-        return result
-
-    status_lower = status.lower()
-
-    # Map to client status enum
-    if status_lower in TRACOS_TO_CLIENT_STATUS:
-        result["status"] = TRACOS_TO_CLIENT_STATUS[status_lower]
-
-    # Also set boolean flags for backward compatibility
-    if status_lower == "completed":
-        result["flags"]["isDone"] = True
-    elif status_lower == "cancelled":
-        result["flags"]["isCanceled"] = True
-    elif status_lower == "on_hold":
-        result["flags"]["isOnHold"] = True
-    elif status_lower == "pending":
-        result["flags"]["isPending"] = True
-    # deleted flag is handled separately in the main translation function
-
-    return result
+    template = (_TRACOS_STATUS_TABLE.get(status) or _TRACOS_STATUS_TABLE.get(status.lower())) if status else None
+    if template is None:
+        template = _EMPTY_STATUS_TEMPLATE
+
+    # Copy on the way out: handing the template itself to callers would
+    # let one caller's flag write corrupt every later result
+    return {"status": template["status"], "flags": dict(template["flags"])}
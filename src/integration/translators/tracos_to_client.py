@@ -2,39 +2,58 @@
 Translation logic from TracOS format to Client format.
 """
 from datetime import datetime, timezone
+from typing import Optional
+
 from integration.translators.status_mappings import map_tracos_status_to_client
 from integration.types import ClientWorkorder, TracOSWorkorder
 
+# timezone.utc pre-bound once; saves an attribute walk on every format
+_UTC = timezone.utc
+
+# Shared fallback timestamp for the current sync run, set by the flow;
+# cached as the ISO string _format_datetime actually returns
+_default_now_iso: Optional[str] = None
+
+
+def set_default_now(dt: Optional[datetime]) -> None:
+    """Set (or clear, with None) the shared fallback timestamp for a run."""
+    global _default_now_iso
+    _default_now_iso = dt.isoformat() if dt is not None else None
+
 
 def translate_tracos_to_client(tracos_workorder: TracOSWorkorder) -> ClientWorkorder:
     """Translate a workorder from TracOS format to Client format."""
 
+    # Hoist each field read into a local: every value is needed at least
+    # once below, and repeated .get() calls pay a hash lookup each
+    is_deleted = tracos_workorder.get("deleted", False)
+
     # Map status: returns both enum value and boolean flags
     status_mapping = map_tracos_status_to_client(tracos_workorder.get("status"))
     status_enum = status_mapping.get("status")
     status_flags = status_mapping.get("flags", {})
 
     # Format dates as ISO strings
-    created_date = _format_datetime(tracos_workorder.get("createdAt"))
-    updated_date = _format_datetime(tracos_workorder.get("updatedAt"))
-
-    # Set deletedDate if workorder is deleted
-    deleted_date = (
-        _format_datetime(tracos_workorder.get("updatedAt")) if tracos_workorder.get("deleted", False) else None
-    )
-
-    result = ClientWorkorder(
-        orderNo=tracos_workorder.get("number"),
-        isCanceled=status_flags.get("isCanceled", False),
-        isDeleted=tracos_workorder.get("deleted", False),
-        isDone=status_flags.get("isDone", False),
-        isOnHold=status_flags.get("isOnHold", False),
-        isPending=status_flags.get("isPending", False),
-        summary=tracos_workorder.get("title", ""),
-        creationDate=created_date,
-        lastUpdateDate=updated_date,
-        deletedDate=deleted_date,
-    )
+    created_date = _format_datetime_fast(tracos_workorder.get("createdAt"))
+    updated_date = _format_datetime_fast(tracos_workorder.get("updatedAt"))
+
+    # Set deletedDate if workorder is deleted; updatedAt is already
+    # formatted above, so reuse it instead of formatting twice
+    deleted_date = updated_date if is_deleted else None
+
+    # The flag template carries exactly the four client flag keys, so it
+    # expands straight into the row instead of four .get() calls. A dict
+    # literal builds the row in one presized BUILD_MAP, where the
+    # TypedDict constructor call paid for a kwargs dict plus a copy
+    result: ClientWorkorder = {
+        "orderNo": tracos_workorder.get("number"),
+        "isDeleted": is_deleted,
+        "summary": tracos_workorder.get("title", ""),
+        "creationDate": created_date,
+        "lastUpdateDate": updated_date,
+        "deletedDate": deleted_date,
+        **status_flags,
+    }
 
     # Add status enum if available
     if status_enum:
@@ -46,5 +65,19 @@ def translate_tracos_to_client(tracos_workorder: TracOSWorkorder) -> ClientWorko
 def _format_datetime(dt: datetime) -> str:
     """Format datetime object to ISO string."""
     if dt is None:
-        return datetime.now(timezone.utc).isoformat()
+        return _default_now_iso or datetime.now(_UTC).isoformat()
     return dt.isoformat() if isinstance(dt, datetime) else str(dt)
+
+
+def _format_datetime_fast(dt: datetime) -> str:
+    """Format a datetime from a trusted source (BSON decode) to ISO.
+
+    Values coming back from Mongo are real datetime objects, so the
+    common path is a direct isoformat() call — the try costs nothing on
+    Python 3.11 unless it actually fires. None and oddly-typed values
+    fall back to the checked formatter, preserving its behavior.
+    """
+    try:
+        return dt.isoformat()
+    except AttributeError:
+        return _format_datetime(dt)
@@ -7,6 +7,7 @@ import asyncio
 from loguru import logger
 from integration.flows.client_to_tracos import ClientToTracOSFlow
 from integration.flows.tracos_to_client import TracOSToClientFlow
+from integration.system.tracos.repository import TracOSRepository
 from os import getenv
 from pathlib import Path
 
@@ -31,6 +32,9 @@ async def main():
     logger.success("Starting TracOS <=> Client Integration Flow")
 
     try:
+        # Make sure the workorder queries have the indexes they expect
+        await TracOSRepository().ensure_indexes()
+
         # Sync client data to TracOS
         client_to_tracos_flow = ClientToTracOSFlow()
         await client_to_tracos_flow.sync(DATA_INBOUND_DIR)
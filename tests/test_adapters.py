@@ -14,7 +14,7 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock
 
 from adapters.filesystem import (
     list_files_in_directory,
@@ -29,7 +29,7 @@ class TestListFilesInDirectory:
 
     def test_list_files_in_empty_directory(self, temp_data_dirs):
         """Test listing files in empty directory returns empty list."""
-        result = list_files_in_directory(str(temp_data_dirs["inbound"]))
+        result = list_files_in_directory(temp_data_dirs["inbound"])
         assert result == []
 
     def test_list_files_returns_file_names(self, temp_data_dirs):
@@ -41,7 +41,7 @@ class TestListFilesInDirectory:
         (inbound / "file2.json").touch()
         (inbound / "file3.py").touch()
 
-        result = list_files_in_directory(str(inbound))
+        result = list_files_in_directory(inbound)
 
         assert len(result) == 3
         assert set(result) == {"file1.txt", "file2.json", "file3.py"}
@@ -54,7 +54,7 @@ class TestListFilesInDirectory:
         (inbound / "file.txt").touch()
         (inbound / "subdir").mkdir()
 
-        result = list_files_in_directory(str(inbound))
+        result = list_files_in_directory(inbound)
 
         assert result == ["file.txt"]
 
@@ -70,7 +70,7 @@ class TestListFilesInDirectory:
         file_path.touch()
 
         with pytest.raises(NotADirectoryError):
-            list_files_in_directory(str(file_path))
+            list_files_in_directory(file_path)
 
 
 class TestListJsonFilesInDirectory:
@@ -86,7 +86,7 @@ class TestListJsonFilesInDirectory:
         (inbound / "file3.txt").touch()
         (inbound / "file4.py").touch()
 
-        result = list_json_files_in_directory(str(inbound))
+        result = list_json_files_in_directory(inbound)
 
         assert len(result) == 2
         assert "file1.json" in result
@@ -94,7 +94,7 @@ class TestListJsonFilesInDirectory:
 
     def test_list_json_files_empty_directory(self, temp_data_dirs):
         """Test empty directory returns empty list."""
-        result = list_json_files_in_directory(str(temp_data_dirs["inbound"]))
+        result = list_json_files_in_directory(temp_data_dirs["inbound"])
         assert result == []
 
     def test_list_json_files_no_json_files(self, temp_data_dirs):
@@ -103,7 +103,7 @@ class TestListJsonFilesInDirectory:
         (inbound / "file.txt").touch()
         (inbound / "file.py").touch()
 
-        result = list_json_files_in_directory(str(inbound))
+        result = list_json_files_in_directory(inbound)
         assert result == []
 
 
@@ -116,10 +116,9 @@ class TestReadJsonFromFile:
         filepath = inbound / "test.json"
 
         data = {"key": "value", "number": 42}
-        with open(filepath, "w") as f:
-            json.dump(data, f)
+        filepath.write_text(json.dumps(data))
 
-        result = read_json_from_file(str(filepath))
+        result = read_json_from_file(filepath)
 
         assert result == data
 
@@ -129,8 +128,7 @@ class TestReadJsonFromFile:
         filepath = inbound / "test.json"
 
         data = {"key": "value"}
-        with open(filepath, "w") as f:
-            json.dump(data, f)
+        filepath.write_text(json.dumps(data))
 
         result = read_json_from_file(filepath)  # Path object
 
@@ -150,7 +148,7 @@ class TestReadJsonFromFile:
             f.write("{invalid json content")
 
         with pytest.raises(json.JSONDecodeError):
-            read_json_from_file(str(filepath))
+            read_json_from_file(filepath)
 
     def test_read_empty_file_raises(self, temp_data_dirs):
         """Test reading empty file raises JSONDecodeError."""
@@ -159,7 +157,7 @@ class TestReadJsonFromFile:
         filepath.touch()  # Create empty file
 
         with pytest.raises(json.JSONDecodeError):
-            read_json_from_file(str(filepath))
+            read_json_from_file(filepath)
 
     def test_read_json_with_unicode(self, temp_data_dirs):
         """Test reading JSON with unicode characters."""
@@ -167,10 +165,9 @@ class TestReadJsonFromFile:
         filepath = inbound / "unicode.json"
 
         data = {"text": "émojis 🔧 and ñ characters"}
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+        filepath.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
 
-        result = read_json_from_file(str(filepath))
+        result = read_json_from_file(filepath)
 
         assert result["text"] == "émojis 🔧 and ñ characters"
 
@@ -184,7 +181,7 @@ class TestWriteJsonToFile:
         filepath = outbound / "new.json"
 
         data = {"key": "value"}
-        write_json_to_file(str(filepath), data)
+        write_json_to_file(filepath, data)
 
         assert filepath.exists()
         with open(filepath) as f:
@@ -196,12 +193,11 @@ class TestWriteJsonToFile:
         filepath = outbound / "existing.json"
 
         # Write initial data
-        with open(filepath, "w") as f:
-            json.dump({"old": "data"}, f)
+        filepath.write_bytes(b'{"old": "data"}')
 
         # Overwrite
         new_data = {"new": "data"}
-        write_json_to_file(str(filepath), new_data)
+        write_json_to_file(filepath, new_data)
 
         with open(filepath) as f:
             assert json.load(f) == new_data
@@ -212,7 +208,7 @@ class TestWriteJsonToFile:
         filepath = root / "new" / "nested" / "dir" / "file.json"
 
         data = {"key": "value"}
-        write_json_to_file(str(filepath), data)
+        write_json_to_file(filepath, data)
 
         assert filepath.exists()
 
@@ -237,7 +233,7 @@ class TestWriteJsonToFile:
         data = {"date": datetime.now()}
 
         with pytest.raises(TypeError):
-            write_json_to_file(str(filepath), data)
+            write_json_to_file(filepath, data)
 
     def test_write_json_atomic_on_error(self, temp_data_dirs):
         """Test that atomic write doesn't corrupt existing file on error."""
@@ -246,14 +242,13 @@ class TestWriteJsonToFile:
 
         # Write initial valid data
         original = {"original": "data"}
-        with open(filepath, "w") as f:
-            json.dump(original, f)
+        filepath.write_text(json.dumps(original))
 
         # Try to write non-serializable data
         from datetime import datetime
 
         try:
-            write_json_to_file(str(filepath), {"date": datetime.now()})
+            write_json_to_file(filepath, {"date": datetime.now()})
         except TypeError:
             pass
 
@@ -267,7 +262,7 @@ class TestWriteJsonToFile:
         filepath = outbound / "unicode.json"
 
         data = {"text": "émojis 🔧 and ñ characters"}
-        write_json_to_file(str(filepath), data)
+        write_json_to_file(filepath, data)
 
         with open(filepath, encoding="utf-8") as f:
             result = json.load(f)
@@ -280,7 +275,7 @@ class TestWriteJsonToFile:
         filepath = outbound / "formatted.json"
 
         data = {"key": "value", "nested": {"a": 1, "b": 2}}
-        write_json_to_file(str(filepath), data)
+        write_json_to_file(filepath, data)
 
         with open(filepath) as f:
             content = f.read()
@@ -294,19 +289,29 @@ class TestDatabaseAdapter:
     """Tests for database adapter module."""
 
     @pytest.mark.asyncio
-    async def test_get_connection_with_mongodb(self):
+    async def test_get_connection_with_mongodb(self, monkeypatch):
         """Test get_connection returns database for mongodb driver."""
+        from adapters import db as db_module
         from adapters.db import get_connection
 
-        with patch.dict(os.environ, {"DATABASE_DRIVER": "mongodb"}):
-            with patch("adapters.db.get_mongodb_connection_with_retry", new_callable=AsyncMock) as mock:
-                mock_db = MagicMock()
-                mock.return_value = mock_db
+        # A hand-written async stub: AsyncMock builds full MagicMock
+        # machinery (spec scanning, call recording) for what is here a
+        # single one-shot return
+        mock_db = MagicMock()
+        calls = 0
+
+        async def stub_retry():
+            nonlocal calls
+            calls += 1
+            return mock_db
+
+        monkeypatch.setenv("DATABASE_DRIVER", "mongodb")
+        monkeypatch.setattr(db_module, "get_mongodb_connection_with_retry", stub_retry)
 
-                result = await get_connection()
+        result = await get_connection()
 
-                assert result == mock_db
-                mock.assert_called_once()
+        assert result == mock_db
+        assert calls == 1
 
     @pytest.mark.asyncio
     async def test_get_connection_unsupported_driver_raises(self):
@@ -364,12 +369,11 @@ class TestFileSystemEdgeCases:
 
         # Write with BOM
         data = {"key": "value"}
-        with open(filepath, "w", encoding="utf-8-sig") as f:
-            json.dump(data, f)
+        filepath.write_text(json.dumps(data), encoding="utf-8-sig")
 
         # Current implementation raises error for BOM files
         with pytest.raises(json.JSONDecodeError):
-            read_json_from_file(str(filepath))
+            read_json_from_file(filepath)
 
     def test_write_json_large_file(self, temp_data_dirs):
         """Test writing large JSON file."""
@@ -379,7 +383,7 @@ class TestFileSystemEdgeCases:
         # Create large data (list of 10000 items)
         data = {"items": [{"id": i, "name": f"Item {i}"} for i in range(10000)]}
 
-        write_json_to_file(str(filepath), data)
+        write_json_to_file(filepath, data)
 
         with open(filepath) as f:
             result = json.load(f)
@@ -401,7 +405,7 @@ class TestFileSystemEdgeCases:
         except OSError:
             pytest.skip("Symlinks not supported")
 
-        result = list_files_in_directory(str(inbound))
+        result = list_files_in_directory(inbound)
 
         # Should include both real file and symlink
         assert len(result) == 2
@@ -416,6 +420,6 @@ class TestFileSystemEdgeCases:
         filepath = special_dir / "file.json"
 
         data = {"key": "value"}
-        write_json_to_file(str(filepath), data)
+        write_json_to_file(filepath, data)
 
         assert filepath.exists()
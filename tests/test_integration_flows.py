@@ -17,6 +17,32 @@ from unittest.mock import patch, MagicMock, AsyncMock
 from integration.flows.client_to_tracos import ClientToTracOSFlow
 from integration.flows.tracos_to_client import TracOSToClientFlow
 
+# Fixed timestamp for seeding mock storage. No test asserts on
+# recency, so a constant replaces a clock read (plus tzinfo lookup) per
+# seeded field.
+_NOW = datetime(2025, 11, 5, 12, 0, 0, tzinfo=timezone.utc)
+
+# Shared client workorder template for tests that seed inbound files.
+# Tests derive payloads as {**_BASE_WORKORDER, **overrides} instead of
+# restating the same ten-key literal per test.
+_BASE_WORKORDER = {
+    "orderNo": 1,
+    "isCanceled": False,
+    "isDeleted": False,
+    "isDone": False,
+    "isOnHold": False,
+    "isPending": False,
+    "summary": "",
+    "creationDate": "2025-11-01T10:00:00+00:00",
+    "lastUpdateDate": "2025-11-01T12:00:00+00:00",
+    "deletedDate": None,
+}
+
+
+def _workorder_json(**overrides) -> str:
+    """Serialize the base workorder with per-test overrides applied."""
+    return json.dumps({**_BASE_WORKORDER, **overrides})
+
 
 class TestClientToTracOSFlow:
     """End-to-end tests for Client → TracOS synchronization."""
@@ -51,28 +77,14 @@ class TestClientToTracOSFlow:
         inbound_dir = temp_data_dirs["inbound"]
 
         # Write valid workorder
-        valid = {
-            "orderNo": 1,
-            "isCanceled": False,
-            "isDeleted": False,
-            "isDone": False,
-            "isOnHold": False,
-            "isPending": False,
-            "summary": "Valid workorder",
-            "creationDate": "2025-11-01T10:00:00+00:00",
-            "lastUpdateDate": "2025-11-01T12:00:00+00:00",
-            "deletedDate": None,
-        }
-        with open(inbound_dir / "1.json", "w") as f:
-            json.dump(valid, f)
+        (inbound_dir / "1.json").write_text(_workorder_json(orderNo=1, summary="Valid workorder"))
 
         # Write invalid workorder (missing required field)
         invalid = {
             "orderNo": 2,
             # Missing other required fields
         }
-        with open(inbound_dir / "2.json", "w") as f:
-            json.dump(invalid, f)
+        (inbound_dir / "2.json").write_text(json.dumps(invalid))
 
         flow = ClientToTracOSFlow()
         await flow.sync(inbound_dir)
@@ -99,21 +111,15 @@ class TestClientToTracOSFlow:
         inbound_dir = temp_data_dirs["inbound"]
 
         # Write workorder with specific values
-        workorder = {
-            "orderNo": 42,
-            "status": "COMPLETED",
-            "isCanceled": False,
-            "isDeleted": False,
-            "isDone": True,
-            "isOnHold": False,
-            "isPending": False,
-            "summary": "Test translation",
-            "creationDate": "2025-11-01T10:00:00+00:00",
-            "lastUpdateDate": "2025-11-01T15:00:00+00:00",
-            "deletedDate": None,
-        }
-        with open(inbound_dir / "42.json", "w") as f:
-            json.dump(workorder, f)
+        (inbound_dir / "42.json").write_text(
+            _workorder_json(
+                orderNo=42,
+                status="COMPLETED",
+                isDone=True,
+                summary="Test translation",
+                lastUpdateDate="2025-11-01T15:00:00+00:00",
+            )
+        )
 
         flow = ClientToTracOSFlow()
         await flow.sync(inbound_dir)
@@ -148,8 +154,8 @@ class TestTracOSToClientFlow:
                     "status": "completed",
                     "title": "Test 1",
                     "description": "Desc 1",
-                    "createdAt": datetime.now(timezone.utc),
-                    "updatedAt": datetime.now(timezone.utc),
+                    "createdAt": _NOW,
+                    "updatedAt": _NOW,
                     "deleted": False,
                     "isSynced": False,
                 },
@@ -158,8 +164,8 @@ class TestTracOSToClientFlow:
                     "status": "pending",
                     "title": "Test 2",
                     "description": "Desc 2",
-                    "createdAt": datetime.now(timezone.utc),
-                    "updatedAt": datetime.now(timezone.utc),
+                    "createdAt": _NOW,
+                    "updatedAt": _NOW,
                     "deleted": False,
                     "isSynced": False,
                 },
@@ -187,8 +193,8 @@ class TestTracOSToClientFlow:
                     "status": "completed",
                     "title": "Unsynced",
                     "description": "Desc",
-                    "createdAt": datetime.now(timezone.utc),
-                    "updatedAt": datetime.now(timezone.utc),
+                    "createdAt": _NOW,
+                    "updatedAt": _NOW,
                     "deleted": False,
                     "isSynced": False,
                 },
@@ -197,8 +203,8 @@ class TestTracOSToClientFlow:
                     "status": "completed",
                     "title": "Already synced",
                     "description": "Desc",
-                    "createdAt": datetime.now(timezone.utc),
-                    "updatedAt": datetime.now(timezone.utc),
+                    "createdAt": _NOW,
+                    "updatedAt": _NOW,
                     "deleted": False,
                     "isSynced": True,
                 },
@@ -225,8 +231,8 @@ class TestTracOSToClientFlow:
                 "status": "completed",
                 "title": "Test",
                 "description": "Desc",
-                "createdAt": datetime.now(timezone.utc),
-                "updatedAt": datetime.now(timezone.utc),
+                "createdAt": _NOW,
+                "updatedAt": _NOW,
                 "deleted": False,
                 "isSynced": False,
             }
@@ -251,8 +257,8 @@ class TestTracOSToClientFlow:
                 "status": "completed",
                 "title": "Test",
                 "description": "Desc",
-                "createdAt": datetime.now(timezone.utc),
-                "updatedAt": datetime.now(timezone.utc),
+                "createdAt": _NOW,
+                "updatedAt": _NOW,
                 "deleted": False,
                 "isSynced": False,
             }
@@ -350,8 +356,8 @@ class TestTracOSToClientFlow:
             "status": "completed",
             "title": None,  # None is not allowed
             "description": "Desc",
-            "createdAt": datetime.now(timezone.utc),
-            "updatedAt": datetime.now(timezone.utc),
+            "createdAt": _NOW,
+            "updatedAt": _NOW,
             "deleted": False,
         }
 
@@ -379,22 +385,20 @@ class TestIntegrationEdgeCases:
         """Test processing a large batch of workorders."""
         inbound_dir = temp_data_dirs["inbound"]
 
-        # Create 50 workorders
+        # Create 50 workorders: serialize everything up front (one dict
+        # reused, only the varying fields mutated per iteration), then
+        # write each payload in a single call
+        workorder = dict(_BASE_WORKORDER)
+        payloads = []
         for i in range(50):
-            workorder = {
-                "orderNo": i,
-                "isCanceled": False,
-                "isDeleted": False,
-                "isDone": i % 3 == 0,  # Every 3rd is done
-                "isOnHold": False,
-                "isPending": i % 5 == 0,  # Every 5th is pending
-                "summary": f"Workorder #{i}",
-                "creationDate": "2025-11-01T10:00:00+00:00",
-                "lastUpdateDate": "2025-11-01T12:00:00+00:00",
-                "deletedDate": None,
-            }
-            with open(inbound_dir / f"{i}.json", "w") as f:
-                json.dump(workorder, f)
+            workorder["orderNo"] = i
+            workorder["isDone"] = i % 3 == 0  # Every 3rd is done
+            workorder["isPending"] = i % 5 == 0  # Every 5th is pending
+            workorder["summary"] = f"Workorder #{i}"
+            payloads.append((i, json.dumps(workorder)))
+
+        for i, payload in payloads:
+            (inbound_dir / f"{i}.json").write_text(payload)
 
         flow = ClientToTracOSFlow()
         await flow.sync(inbound_dir)
@@ -408,20 +412,9 @@ class TestIntegrationEdgeCases:
         """Test workorder with special characters in title/summary."""
         inbound_dir = temp_data_dirs["inbound"]
 
-        workorder = {
-            "orderNo": 1,
-            "isCanceled": False,
-            "isDeleted": False,
-            "isDone": False,
-            "isOnHold": False,
-            "isPending": False,
-            "summary": 'Test with émojis 🔧, <html> tags, & "quotes", null\x00bytes',
-            "creationDate": "2025-11-01T10:00:00+00:00",
-            "lastUpdateDate": "2025-11-01T12:00:00+00:00",
-            "deletedDate": None,
-        }
-        with open(inbound_dir / "1.json", "w") as f:
-            json.dump(workorder, f)
+        (inbound_dir / "1.json").write_text(
+            _workorder_json(summary='Test with émojis 🔧, <html> tags, & "quotes", null\x00bytes')
+        )
 
         flow = ClientToTracOSFlow()
         await flow.sync(inbound_dir)
@@ -443,20 +436,14 @@ class TestFlowDataIntegrity:
 
         # Create original client workorder
         original = {
+            **_BASE_WORKORDER,
             "orderNo": 999,
             "status": "COMPLETED",
-            "isCanceled": False,
-            "isDeleted": False,
             "isDone": True,
-            "isOnHold": False,
-            "isPending": False,
             "summary": "Round trip test",
-            "creationDate": "2025-11-01T10:00:00+00:00",
             "lastUpdateDate": "2025-11-01T15:00:00+00:00",
-            "deletedDate": None,
         }
-        with open(inbound_dir / "999.json", "w") as f:
-            json.dump(original, f)
+        (inbound_dir / "999.json").write_text(json.dumps(original))
 
         # Sync client → TracOS
         client_to_tracos = ClientToTracOSFlow()
@@ -487,21 +474,15 @@ class TestFlowDataIntegrity:
         collection = mock_db_connection["collection"]
 
         # Create deleted workorder
-        deleted = {
-            "orderNo": 1,
-            "status": "DELETED",
-            "isCanceled": False,
-            "isDeleted": True,
-            "isDone": False,
-            "isOnHold": False,
-            "isPending": False,
-            "summary": "Deleted workorder",
-            "creationDate": "2025-11-01T10:00:00+00:00",
-            "lastUpdateDate": "2025-11-01T16:00:00+00:00",
-            "deletedDate": "2025-11-01T16:00:00+00:00",
-        }
-        with open(inbound_dir / "1.json", "w") as f:
-            json.dump(deleted, f)
+        (inbound_dir / "1.json").write_text(
+            _workorder_json(
+                status="DELETED",
+                isDeleted=True,
+                summary="Deleted workorder",
+                lastUpdateDate="2025-11-01T16:00:00+00:00",
+                deletedDate="2025-11-01T16:00:00+00:00",
+            )
+        )
 
         # Sync client → TracOS
         client_to_tracos = ClientToTracOSFlow()
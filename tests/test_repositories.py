@@ -17,6 +17,34 @@ from unittest.mock import patch, MagicMock, AsyncMock
 from integration.system.client.repository import ClientRepository
 from integration.system.tracos.repository import TracOSRepository
 
+# Valid base workorder for malformed-input cases. Each case below is a
+# small delta over this dict, so one base allocation replaces five
+# near-identical ten-key literals.
+_MALFORMED_BASE = {
+    "orderNo": 1,
+    "isCanceled": False,
+    "isDeleted": False,
+    "isDone": False,
+    "isOnHold": False,
+    "isPending": False,
+    "summary": "Malformed workorder case",
+    "creationDate": "2025-11-01T10:00:00+00:00",
+    "lastUpdateDate": "2025-11-01T12:00:00+00:00",
+    "deletedDate": None,
+}
+
+# Sentinel meaning "remove this key from the base"
+_ABSENT = object()
+
+# (case id, delta applied over _MALFORMED_BASE)
+MALFORMED_WORKORDER_CASES = [
+    ("missing_isDeleted", {"isDeleted": _ABSENT}),
+    ("wrong_type_orderNo", {"orderNo": "not_an_int"}),
+    ("invalid_creationDate", {"creationDate": "not-a-date"}),
+    ("deleted_with_invalid_deletedDate", {"isDeleted": True, "deletedDate": "invalid-date"}),
+    ("not_deleted_but_has_deletedDate", {"deletedDate": "2025-11-01T16:00:00+00:00"}),
+]
+
 
 class TestClientRepository:
     """Tests for ClientRepository (file-based operations)."""
@@ -61,44 +89,17 @@ class TestClientRepository:
         assert result is not None
         assert result["orderNo"] == sample_client_workorder["orderNo"]
 
-    def test_validate_workorder_missing_required_field(self, malformed_client_workorders):
-        """Test validation rejects workorder missing required field."""
-        repo = ClientRepository()
-
-        # First workorder is missing isDeleted
-        result = repo.validate_workorder(malformed_client_workorders[0])
-        assert result is None
-
-    def test_validate_workorder_wrong_type(self, malformed_client_workorders):
-        """Test validation rejects workorder with wrong field type."""
-        repo = ClientRepository()
-
-        # Second workorder has string orderNo instead of int
-        result = repo.validate_workorder(malformed_client_workorders[1])
-        assert result is None
-
-    def test_validate_workorder_invalid_date(self, malformed_client_workorders):
-        """Test validation rejects workorder with invalid date format."""
-        repo = ClientRepository()
-
-        # Third workorder has invalid creationDate
-        result = repo.validate_workorder(malformed_client_workorders[2])
-        assert result is None
+    @pytest.mark.parametrize("case", MALFORMED_WORKORDER_CASES, ids=lambda case: case[0])
+    def test_validate_workorder_rejects_malformed(self, case):
+        """Test validation rejects each malformed delta over a valid base."""
+        _, delta = case
+        workorder = {**_MALFORMED_BASE, **delta}
+        for field, value in delta.items():
+            if value is _ABSENT:
+                del workorder[field]
 
-    def test_validate_workorder_deleted_with_invalid_date(self, malformed_client_workorders):
-        """Test validation rejects deleted workorder with invalid deletedDate."""
         repo = ClientRepository()
-
-        # Fourth workorder is deleted but has invalid deletedDate
-        result = repo.validate_workorder(malformed_client_workorders[3])
-        assert result is None
-
-    def test_validate_workorder_not_deleted_but_has_deleted_date(self, malformed_client_workorders):
-        """Test validation rejects not-deleted workorder with deletedDate set."""
-        repo = ClientRepository()
-
-        # Fifth workorder is not deleted but has deletedDate
-        result = repo.validate_workorder(malformed_client_workorders[4])
+        result = repo.validate_workorder(workorder)
         assert result is None
 
     def test_is_iso_datetime_valid_formats(self):
@@ -16,29 +16,59 @@ from integration.translators.status_mappings import (
     TRACOS_TO_CLIENT_STATUS,
 )
 
+# Mapping cases as module constants so each becomes its own parametrized
+# test node: failures report per case and pytest-xdist can distribute them
+CLIENT_TO_TRACOS_ENUM_CASES = [
+    {"status": "NEW", "flags": None, "expected": "created"},
+    {"status": "PENDING", "flags": None, "expected": "pending"},
+    {"status": "IN_PROGRESS", "flags": None, "expected": "in_progress"},
+    {"status": "ON_HOLD", "flags": None, "expected": "on_hold"},
+    {"status": "COMPLETED", "flags": None, "expected": "completed"},
+    {"status": "CANCELLED", "flags": None, "expected": "cancelled"},
+    {"status": "CANCELED", "flags": None, "expected": "cancelled"},  # Alternate spelling
+    {"status": "DELETED", "flags": None, "expected": "deleted"},
+    # Unknown status falls back to flags
+    {"status": "UNKNOWN_STATUS", "flags": {"isDone": True}, "expected": "completed"},
+]
+
+CLIENT_TO_TRACOS_FLAG_CASES = [
+    {"flags": {"isDone": True}, "expected": "completed"},
+    {"flags": {"isCanceled": True}, "expected": "cancelled"},
+    {"flags": {"isOnHold": True}, "expected": "on_hold"},
+    {"flags": {"isPending": True}, "expected": "pending"},
+    {"flags": {"isDeleted": True}, "expected": "deleted"},
+]
+
+TRACOS_TO_CLIENT_CASES = [
+    {"status": "created", "expected_status": "NEW", "expected_flags": {}},
+    {"status": "pending", "expected_status": "PENDING", "expected_flags": {"isPending": True}},
+    {"status": "in_progress", "expected_status": "IN_PROGRESS", "expected_flags": {}},
+    {"status": "on_hold", "expected_status": "ON_HOLD", "expected_flags": {"isOnHold": True}},
+    {"status": "completed", "expected_status": "COMPLETED", "expected_flags": {"isDone": True}},
+    {"status": "cancelled", "expected_status": "CANCELLED", "expected_flags": {"isCanceled": True}},
+    {"status": "deleted", "expected_status": "DELETED", "expected_flags": {}},
+    # Edge cases
+    {"status": None, "expected_status": None, "expected_flags": {}},
+    {"status": "", "expected_status": None, "expected_flags": {}},
+]
+
 
 class TestClientToTracOSStatusMapping:
     """Tests for Client → TracOS status mapping."""
 
-    def test_all_enum_mappings(self, client_to_tracos_status_cases):
+    @pytest.mark.parametrize("case", CLIENT_TO_TRACOS_ENUM_CASES, ids=lambda c: f"{c['status']}->{c['expected']}")
+    def test_all_enum_mappings(self, case):
         """Test all documented status enum mappings."""
-        enum_cases = [c for c in client_to_tracos_status_cases if c.get("status")]
-
-        for case in enum_cases:
-            result = map_client_status_to_tracos(status=case["status"], flags=case.get("flags"))
-            assert (
-                result == case["expected"]
-            ), f"Status '{case['status']}' should map to '{case['expected']}', got '{result}'"
+        result = map_client_status_to_tracos(status=case["status"], flags=case.get("flags"))
+        assert (
+            result == case["expected"]
+        ), f"Status '{case['status']}' should map to '{case['expected']}', got '{result}'"
 
-    def test_flag_based_mapping(self, client_to_tracos_status_cases):
+    @pytest.mark.parametrize("case", CLIENT_TO_TRACOS_FLAG_CASES, ids=lambda c: f"{c['flags']}->{c['expected']}")
+    def test_flag_based_mapping(self, case):
         """Test flag-based status mapping (backward compatibility)."""
-        flag_cases = [c for c in client_to_tracos_status_cases if c.get("status") is None and c.get("flags")]
-
-        for case in flag_cases:
-            result = map_client_status_to_tracos(status=None, flags=case["flags"])
-            assert (
-                result == case["expected"]
-            ), f"Flags {case['flags']} should map to '{case['expected']}', got '{result}'"
+        result = map_client_status_to_tracos(status=None, flags=case["flags"])
+        assert result == case["expected"], f"Flags {case['flags']} should map to '{case['expected']}', got '{result}'"
 
     def test_case_insensitivity(self):
         """Test that status matching is case-insensitive."""
@@ -127,25 +157,25 @@ class TestClientToTracOSStatusMapping:
 class TestTracOSToClientStatusMapping:
     """Tests for TracOS → Client status mapping."""
 
-    def test_all_enum_mappings(self, tracos_to_client_status_cases):
+    @pytest.mark.parametrize("case", TRACOS_TO_CLIENT_CASES, ids=lambda c: f"{c['status']}->{c['expected_status']}")
+    def test_all_enum_mappings(self, case):
         """Test all documented TracOS → Client status mappings."""
-        for case in tracos_to_client_status_cases:
-            result = map_tracos_status_to_client(status=case["status"])
+        result = map_tracos_status_to_client(status=case["status"])
 
-            assert (
-                result["status"] == case["expected_status"]
-            ), f"Status '{case['status']}' should map to '{case['expected_status']}', got '{result['status']}'"
+        assert (
+            result["status"] == case["expected_status"]
+        ), f"Status '{case['status']}' should map to '{case['expected_status']}', got '{result['status']}'"
 
-    def test_correct_flags_set(self, tracos_to_client_status_cases):
+    @pytest.mark.parametrize("case", TRACOS_TO_CLIENT_CASES, ids=lambda c: f"{c['status']}->{c['expected_status']}")
+    def test_correct_flags_set(self, case):
         """Test that correct boolean flags are set for each status."""
-        for case in tracos_to_client_status_cases:
-            result = map_tracos_status_to_client(status=case["status"])
-
-            for flag_name, expected_value in case["expected_flags"].items():
-                actual_value = result["flags"].get(flag_name, False)
-                assert (
-                    actual_value == expected_value
-                ), f"For status '{case['status']}', flag '{flag_name}' should be {expected_value}, got {actual_value}"
+        result = map_tracos_status_to_client(status=case["status"])
+
+        for flag_name, expected_value in case["expected_flags"].items():
+            actual_value = result["flags"].get(flag_name, False)
+            assert (
+                actual_value == expected_value
+            ), f"For status '{case['status']}', flag '{flag_name}' should be {expected_value}, got {actual_value}"
 
     def test_case_insensitivity(self):
         """Test that status matching is case-insensitive."""